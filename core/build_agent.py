@@ -14,26 +14,69 @@ from core.tools.generation import build_next_step
 from core.playwright_env import ensure_playwright_environment
 
 
+_PAGE_STATE_LABEL_RE = re.compile(
+    r'(?:Page State|Interactive Elements|Additional Page State|Final Page State)[:\s]*'
+)
+
+_JSON_DECODER = json.JSONDecoder()
+
+_ERROR_LINE_KEYWORDS = ('playwright requires', 'node.js', 'error:', 'warning:', 'exception')
+
+_RUNNER_LINE_KEYWORDS = ('running', 'test outcome', 'failed', 'passed')
+
+_LOG_PREFIXES = {
+    'info': '→',
+    'debug': '  ',
+    'success': '✓',
+    'error': '✗',
+    'warning': '⚠',
+}
+
+
+def _extract_page_state_blocks(output: str) -> list[str]:
+    if '{' not in output:
+        return []
+    
+    blocks = []
+    position = 0
+    
+    while True:
+        match = _PAGE_STATE_LABEL_RE.search(output, position)
+        if not match:
+            return blocks
+        
+        start = match.end()
+        position = start
+        if not output.startswith('{', start):
+            continue
+        
+        try:
+            _, end = _JSON_DECODER.raw_decode(output, start)
+        except json.JSONDecodeError:
+            end = output.find('}', start) + 1
+            if not end:
+                return blocks
+        
+        blocks.append(output[start:end])
+        position = end
+
+
 def _filter_page_state_output(output: str) -> str:
     if not output:
         return ''
     
-    json_pattern = r'(?:Page State|Interactive Elements|Additional Page State|Final Page State)[:\s]*\n?(\{.*?\})'
-    matches = re.findall(json_pattern, output, re.DOTALL)
+    matches = _extract_page_state_blocks(output)
     
     if matches:
-        return '\n\n'.join(matches)
+        return '\n\n'.join(dict.fromkeys(matches))
     
-    lines = output.split('\n')
     filtered_lines = []
     skip_line = False
     
-    for line in lines:
+    for line in output.splitlines():
         stripped = line.strip().lower()
         
-        if any(error_keyword in stripped for error_keyword in [
-            'playwright requires', 'node.js', 'error:', 'warning:', 'exception'
-        ]):
+        if any(keyword in stripped for keyword in _ERROR_LINE_KEYWORDS):
             skip_line = True
             continue
         
@@ -43,9 +86,7 @@ def _filter_page_state_output(output: str) -> str:
         if skip_line:
             continue
         
-        if stripped and not any(prefix in stripped for prefix in [
-            'running', 'test outcome', 'failed', 'passed'
-        ]):
+        if stripped and not any(keyword in stripped for keyword in _RUNNER_LINE_KEYWORDS):
             filtered_lines.append(line)
     
     return '\n'.join(filtered_lines).strip()
@@ -63,13 +104,7 @@ class BuildAgent:
     
     def _log(self, message: str, level: str = 'info', data: dict = None):
         indent = '  ' * self._indent_level
-        prefix = {
-            'info': '→',
-            'debug': '  ',
-            'success': '✓',
-            'error': '✗',
-            'warning': '⚠',
-        }.get(level, '→')
+        prefix = _LOG_PREFIXES.get(level, '→')
         
         print(f'{indent}{prefix} {message}', flush=True)
         
@@ -84,6 +119,9 @@ class BuildAgent:
     
     def _pop_indent(self):
         self._indent_level = max(0, self._indent_level - 1)
+    
+    def _spec_path(self, scenario: Scenario) -> Path:
+        return self.glyph_dir / (Path(scenario.name).stem + '.spec.js')
 
     def build_all_scenarios(self, scenarios: list[Scenario]) -> BuildProgress:
         self._log(f'Starting build process for {len(scenarios)} scenario(s)')
@@ -91,6 +129,10 @@ class BuildAgent:
         progress = BuildProgress.load(self.progress_path)
         
         scenario_dict = {scenario.name: scenario for scenario in scenarios}
+        all_scenarios_text = self.template_manager.list_scenarios([
+            {'path': s.name, 'text': s.text}
+            for s in scenario_dict.values()
+        ])
         
         for scenario in scenarios:
             if scenario.name not in progress.scenarios:
@@ -103,18 +145,18 @@ class BuildAgent:
         
         progress.save(self.progress_path)
         
-        total = len(progress.get_not_yet_implemented())
+        pending = progress.get_not_yet_implemented()
+        total = len(pending)
         completed_count = 0
         
-        while progress.get_not_yet_implemented():
-            remaining = len(progress.get_not_yet_implemented())
-            scenario_name = progress.get_not_yet_implemented()[0]
+        while pending:
+            scenario_name = pending[0]
             scenario = scenario_dict[scenario_name]
             
             self._log(f'[{completed_count + 1}/{total}] Building: {scenario_name}')
             self._push_indent()
             
-            success = self.build_scenario(scenario, progress, scenario_dict)
+            success = self.build_scenario(scenario, progress, all_scenarios_text)
             progress.save(self.progress_path)
             
             self._pop_indent()
@@ -126,23 +168,22 @@ class BuildAgent:
                 self._log(f'Failed: {scenario_name}', 'error')
             
             print()
+            pending = progress.get_not_yet_implemented()
         
         return progress
 
-    def build_scenario(self, scenario: Scenario, progress: BuildProgress, scenario_dict: dict[str, Scenario]) -> bool:
+    def build_scenario(self, scenario: Scenario, progress: BuildProgress, all_scenarios_text: str) -> bool:
         progress.mark_in_progress(scenario.name)
         progress.save(self.progress_path)
         
         self._log('Starting iterative build...')
         self._push_indent()
-        success = self.iterative_build(scenario, progress, scenario_dict)
+        success = self.iterative_build(scenario, progress, all_scenarios_text)
         self._pop_indent()
         
         if success:
             scenario_progress = progress.scenarios[scenario.name]
-            glyph_dir = ensure_playwright_environment(self.config.connection_url)
-            spec_filename = Path(scenario.name).stem + '.spec.js'
-            spec_path = glyph_dir / spec_filename
+            spec_path = self._spec_path(scenario)
             
             if not spec_path.exists():
                 if scenario_progress.current_spec_code:
@@ -161,7 +202,7 @@ class BuildAgent:
         
         return success
 
-    def iterative_build(self, scenario: Scenario, progress: BuildProgress, scenario_dict: dict[str, Scenario]) -> bool:
+    def iterative_build(self, scenario: Scenario, progress: BuildProgress, all_scenarios_text: str) -> bool:
         scenario_progress = progress.scenarios[scenario.name]
         
         if not scenario_progress.step_list:
@@ -188,12 +229,6 @@ class BuildAgent:
         completed_steps = scenario_progress.completed_steps or []
         total_steps = len(step_list)
         
-        all_scenarios_list = [
-            {'path': s.name, 'text': s.text}
-            for s in scenario_dict.values()
-        ]
-        all_scenarios_text = self.template_manager.list_scenarios(all_scenarios_list)
-        
         while len(completed_steps) < total_steps:
             current_step_index = len(completed_steps)
             step_description = step_list[current_step_index] if current_step_index < len(step_list) else 'Unknown step'
@@ -277,10 +312,7 @@ class BuildAgent:
         
         self._log('All steps completed', 'success')
         
-        scenario_progress = progress.scenarios[scenario.name]
-        glyph_dir = ensure_playwright_environment(self.config.connection_url)
-        spec_filename = Path(scenario.name).stem + '.spec.js'
-        spec_path = glyph_dir / spec_filename
+        spec_path = self._spec_path(scenario)
         spec_path.write_text(current_spec)
         progress.update_spec_code(scenario.name, current_spec)
         
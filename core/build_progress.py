@@ -1,4 +1,5 @@
 import json
+import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -38,6 +39,7 @@ class BuildProgress:
     def __init__(self):
         self.scenarios: Dict[str, ScenarioProgress] = {}
         self.current_scenario: Optional[str] = None
+        self._saved_payload: Optional[tuple] = None
 
     def get_not_yet_implemented(self) -> List[str]:
         return [
@@ -110,7 +112,13 @@ class BuildProgress:
             },
             'current_scenario': self.current_scenario
         }
-        path.write_text(json.dumps(data, indent=2))
+        payload = json.dumps(data, indent=2)
+        if self._saved_payload == (path, payload) and path.exists():
+            return
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_text(payload)
+        os.replace(temp_path, path)
+        self._saved_payload = (path, payload)
 
     @classmethod
     def load(cls, path: Path) -> 'BuildProgress':
@@ -7,6 +7,13 @@ from core.template_manager import TemplateManager
 from core.pipeline import PipelineContext
 from core.stages import LoadStage
 from core.build_agent import BuildAgent
+from core.playwright_env import ensure_playwright_environment
+
+
+_STATUS_SYMBOLS = {
+    'completed': '✓',
+    'failed': '✗',
+}
 
 
 class CLI:
@@ -16,6 +23,11 @@ class CLI:
         
         self._setup_build_command()
         self._setup_purge_command()
+        
+        self._handlers = {
+            'build': self._handle_build,
+            'purge': self._handle_purge,
+        }
     
     def _setup_build_command(self):
         build_parser = self.subparsers.add_parser('build', help='Build test scenarios')
@@ -28,17 +40,12 @@ class CLI:
     def run(self, args=None):
         parsed_args = self.parser.parse_args(args)
         
-        if not parsed_args.command:
+        handler = self._handlers.get(parsed_args.command)
+        if handler is None:
             self.parser.print_help()
             sys.exit(1)
         
-        if parsed_args.command == 'build':
-            self._handle_build(parsed_args)
-        elif parsed_args.command == 'purge':
-            self._handle_purge(parsed_args)
-        else:
-            self.parser.print_help()
-            sys.exit(1)
+        handler(parsed_args)
     
     def _handle_build(self, args):
         config = Config()
@@ -60,7 +67,7 @@ class CLI:
         print('\nBuild Report:')
         print('=' * 60)
         for scenario_path, status in sorted(report.items()):
-            status_symbol = '✓' if status == 'completed' else '✗' if status == 'failed' else '○'
+            status_symbol = _STATUS_SYMBOLS.get(status, '○')
             print(f'{status_symbol} {scenario_path}: {status}')
         print('=' * 60)
         
@@ -71,17 +78,19 @@ class CLI:
         print(f'\nSummary: {completed}/{total} completed, {failed} failed')
     
     def _handle_purge(self, args):
-        from core.playwright_env import ensure_playwright_environment
-        
         config = Config()
         glyph_dir = ensure_playwright_environment(config.connection_url)
         
         files_to_remove = []
         files_to_remove.append(glyph_dir / 'build_progress.json')
+        files_to_remove.append(glyph_dir / 'build_progress.json.tmp')
         
         for spec_file in glyph_dir.glob('*.spec.js'):
             files_to_remove.append(spec_file)
         
+        for cache_file in glyph_dir.glob('llm_cache/*'):
+            files_to_remove.append(cache_file)
+        
         existing_files = [f for f in files_to_remove if f.exists()]
         
         if not existing_files:
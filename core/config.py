@@ -1,4 +1,5 @@
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -19,3 +20,7 @@ class Config:
         self.connection_url = data.get('connection', {}).get('url')
         self.llm_model = data.get('llm', {}).get('model')
 
+
+@lru_cache(maxsize=1)
+def default_config() -> Config:
+    return Config()
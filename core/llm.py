@@ -1,16 +1,28 @@
 import os
 import json
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate, PromptTemplate
 from langchain.schema import HumanMessage, SystemMessage
+from core.config import default_config
+from core.llm_cache import LLMCache
 
 load_dotenv()
 
 
+def _parse_json_response(response):
+    response = response.strip()
+    try:
+        return json.loads(response)
+    except json.JSONDecodeError as e:
+        raise ValueError(f'Failed to parse JSON response: {e}\nResponse: {response[:500]}')
+
+
 class LangChainLLM:
-    def __init__(self, model, api_key=None, temperature=0):
+    def __init__(self, model, api_key=None, temperature=0, cache=None):
         self.model = model
+        self.temperature = temperature
         api_key = api_key or os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError('OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key parameter.')
@@ -20,26 +32,37 @@ class LangChainLLM:
             api_key=api_key,
             temperature=temperature
         )
+        self._cache = cache if cache is not None else LLMCache()
     
-    def process(self, prompt, system_prompt=None):
-        messages = []
+    def process(self, prompt, system_prompt=None, parse=None):
+        cache_key = LLMCache.key(self.model, repr(float(self.temperature)), system_prompt, prompt)
+        response = self._cache.get(cache_key)
+        is_cached = response is not None
         
-        if system_prompt:
-            messages.append(SystemMessage(content=system_prompt))
+        if not is_cached:
+            messages = []
+            
+            if system_prompt:
+                messages.append(SystemMessage(content=system_prompt))
+            
+            messages.append(HumanMessage(content=prompt))
+            
+            response = self.llm.invoke(messages).content
         
-        messages.append(HumanMessage(content=prompt))
+        result = response
+        if parse is not None:
+            try:
+                result = parse(response)
+            except Exception:
+                self._cache.delete(cache_key)
+                raise
         
-        response = self.llm.invoke(messages)
-        return response.content
+        if not is_cached:
+            self._cache.put(cache_key, response, self.model)
+        return result
     
     def process_json(self, prompt, system_prompt=None):
-        response = self.process(prompt, system_prompt)
-        response = response.strip()
-        
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
-            raise ValueError(f'Failed to parse JSON response: {e}\nResponse: {response[:500]}')
+        return self.process(prompt, system_prompt, parse=_parse_json_response)
     
     def process_with_template(self, template_text, **kwargs):
         prompt_template = PromptTemplate.from_template(template_text)
@@ -53,3 +76,6 @@ class LangChainLLM:
         return response.content
 
 
+@lru_cache(maxsize=1)
+def default_llm() -> LangChainLLM:
+    return LangChainLLM(model=default_config().llm_model)
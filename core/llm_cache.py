@@ -0,0 +1,53 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+class LLMCache:
+    def __init__(self, cache_dir=None, enabled=None):
+        if cache_dir is None:
+            cache_dir = Path('.glyph') / 'llm_cache'
+        if enabled is None:
+            enabled = os.getenv('GLYPH_LLM_CACHE', '1') != '0'
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+
+    @staticmethod
+    def key(*parts) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            data = (part or '').encode('utf-8')
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.json'
+
+    def get(self, key: str):
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())['response']
+
+    def put(self, key: str, response: str, model: str):
+        if not self.enabled:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_text(json.dumps({
+            'model': model,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'response': response
+        }))
+        os.replace(temp_path, path)
+
+    def delete(self, key: str):
+        if not self.enabled:
+            return
+        self._path(key).unlink(missing_ok=True)
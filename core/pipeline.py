@@ -1,11 +1,10 @@
 class PipelineContext:
     def __init__(self, **kwargs):
+        self.results = {}
         for key, value in kwargs.items():
             setattr(self, key, value)
     
     def add_result(self, stage_name, result):
-        if not hasattr(self, 'results'):
-            self.results = {}
         self.results[stage_name] = result
 
 
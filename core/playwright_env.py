@@ -1,23 +1,28 @@
 from pathlib import Path
-from core.config import Config
+from core.config import default_config
 from core.template_manager import TemplateManager
 
 
+_prepared_base_urls = {}
+
+
 def ensure_playwright_environment(base_url: str = None) -> Path:
     if base_url is None:
-        config = Config()
-        base_url = config.connection_url or 'http://localhost:3000'
+        base_url = default_config().connection_url or 'http://localhost:3000'
     
     glyph_dir = Path('.glyph')
+    config_path = glyph_dir / 'playwright.config.js'
+    package_json_path = glyph_dir / 'package.json'
+    working_dir = Path.cwd()
+    if _prepared_base_urls.get(working_dir) == base_url and config_path.exists() and package_json_path.exists():
+        return glyph_dir
+    
     glyph_dir.mkdir(exist_ok=True)
     
     template_manager = TemplateManager()
     expected_config = template_manager.playwright_config(base_url)
     expected_package_json = template_manager.package_json()
     
-    config_path = glyph_dir / 'playwright.config.js'
-    package_json_path = glyph_dir / 'package.json'
-    
     needs_config_update = False
     needs_package_json = False
     
@@ -37,8 +42,6 @@ def ensure_playwright_environment(base_url: str = None) -> Path:
     if needs_package_json:
         package_json_path.write_text(expected_package_json)
     
+    _prepared_base_urls[working_dir] = base_url
     return glyph_dir
 
-
-ensure_playwright_environment()
-
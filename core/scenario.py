@@ -9,8 +9,7 @@ class Scenario:
     
     def to_steps(self, llm, template_manager):
         prompt = template_manager.scenario_to_steps(self.text)
-        response = llm.process(prompt)
-        return json.loads(response)
+        return llm.process(prompt, parse=json.loads)
     
     def summarize(self, llm, template_manager):
         if self.summary is None:
@@ -10,7 +10,7 @@ class LoadStage(PipelineStage):
         if not scenarios_dir.exists():
             raise FileNotFoundError(f'Scenarios directory not found: {scenarios_dir}')
         
-        scenario_files = list(scenarios_dir.glob('*.glyph'))
+        scenario_files = sorted(scenarios_dir.glob('*.glyph'))
         scenarios = []
         
         for scenario_file in scenario_files:
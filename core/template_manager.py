@@ -1,77 +1,95 @@
 import os
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+
+_shared_state = {}
+
+
+def _state_for(templates_dir):
+    state = _shared_state.get(templates_dir)
+    if state is None:
+        env = Environment(
+            loader=FileSystemLoader(templates_dir),
+            autoescape=False,
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache()
+        )
+        state = (env, {}, {})
+        _shared_state[templates_dir] = state
+    return state
 
 
 class TemplateManager:
     def __init__(self, templates_dir=None):
         if templates_dir is None:
             templates_dir = Path(__file__).parent.parent / 'prompts'
-        self.env = Environment(loader=FileSystemLoader(str(templates_dir)))
+        self.env, self._templates, self._rendered = _state_for(str(templates_dir))
+    
+    def _template(self, name):
+        template = self._templates.get(name)
+        if template is None:
+            template = self.env.get_template(name)
+            self._templates[name] = template
+        return template
+    
+    def _render(self, name, **context):
+        return self._template(name).render(**context)
+    
+    def _render_cached(self, name, **context):
+        key = (name, tuple(sorted(context.items())))
+        if key not in self._rendered:
+            self._rendered[key] = self._render(name, **context)
+        return self._rendered[key]
     
     def scenario_to_steps(self, scenario_text):
-        template = self.env.get_template('scenario_to_steps.j2')
-        return template.render(scenario_text=scenario_text)
+        return self._render('scenario_to_steps.j2', scenario_text=scenario_text)
     
     def scenario_summarize(self, scenario_text):
-        template = self.env.get_template('scenario_summarize.j2')
-        return template.render(scenario_text=scenario_text)
+        return self._render('scenario_summarize.j2', scenario_text=scenario_text)
     
     def agent_system_prompt(self):
-        template = self.env.get_template('agent_system_prompt.j2')
-        return template.render()
+        return self._render_cached('agent_system_prompt.j2')
     
     def step0_playwright_template(self, base_url):
-        template = self.env.get_template('step0_playwright_template.j2')
-        return template.render(base_url=base_url)
+        return self._render_cached('step0_playwright_template.j2', base_url=base_url)
     
     def playwright_config(self, base_url):
-        template = self.env.get_template('playwright.config.js.j2')
-        return template.render(base_url=base_url)
+        return self._render_cached('playwright.config.js.j2', base_url=base_url)
     
     def package_json(self):
-        template = self.env.get_template('package.json.j2')
-        return template.render()
+        return self._render_cached('package.json.j2')
     
     def compose_spec_system_prompt(self):
-        template = self.env.get_template('compose_spec_system.j2')
-        return template.render()
+        return self._render_cached('compose_spec_system.j2')
     
     def compose_spec_user_prompt(self, base_code, additional_code):
-        template = self.env.get_template('compose_spec_user.j2')
-        return template.render(base_code=base_code, additional_code=additional_code)
+        return self._render('compose_spec_user.j2', base_code=base_code, additional_code=additional_code)
     
     def capture_page_state_template(self, base_url):
-        template = self.env.get_template('capture_page_state.j2')
-        return template.render(base_url=base_url)
+        return self._render_cached('capture_page_state.j2', base_url=base_url)
     
     def analyze_spec_implementation_system_prompt(self):
-        template = self.env.get_template('analyze_spec_implementation_system.j2')
-        return template.render()
+        return self._render_cached('analyze_spec_implementation_system.j2')
     
     def analyze_spec_implementation_user_prompt(self, spec_code, scenario_text):
-        template = self.env.get_template('analyze_spec_implementation_user.j2')
-        return template.render(spec_code=spec_code, scenario_text=scenario_text)
+        return self._render('analyze_spec_implementation_user.j2', spec_code=spec_code, scenario_text=scenario_text)
     
     def generate_next_code_system_prompt(self):
-        template = self.env.get_template('generate_next_code_system.j2')
-        return template.render()
+        return self._render_cached('generate_next_code_system.j2')
     
     def generate_next_code_user_prompt(self, page_state_output, next_step_guidance):
-        template = self.env.get_template('generate_next_code_user.j2')
-        return template.render(page_state_output=page_state_output, next_step_guidance=next_step_guidance)
+        return self._render('generate_next_code_user.j2', page_state_output=page_state_output, next_step_guidance=next_step_guidance)
     
     def list_scenarios(self, scenarios):
-        template = self.env.get_template('list_scenarios.j2')
-        return template.render(scenarios=scenarios)
+        return self._render('list_scenarios.j2', scenarios=scenarios)
     
     def build_next_step_system_prompt(self):
-        template = self.env.get_template('build_next_step_system.j2')
-        return template.render()
+        return self._render_cached('build_next_step_system.j2')
     
     def build_next_step_user_prompt(self, all_scenarios, current_scenario_name, current_scenario_path, current_scenario_text, step_list, completed_steps_indices, current_spec, page_state_output):
-        template = self.env.get_template('build_next_step_user.j2')
-        return template.render(
+        return self._render(
+            'build_next_step_user.j2',
             all_scenarios=all_scenarios,
             current_scenario_name=current_scenario_name,
             current_scenario_path=current_scenario_path,
@@ -1,14 +1,11 @@
-import json
-import re
-from core.config import Config
 from core.template_manager import TemplateManager
-from core.llm import LangChainLLM
+from core.llm import LangChainLLM, default_llm
+from core.tools.parsing import JSON_LANGUAGES, extract_code_block
 
 
 def analyze_spec_implementation(spec_code: str, scenario_text: str, llm: LangChainLLM = None) -> str:
     if llm is None:
-        config = Config()
-        llm = LangChainLLM(model=config.llm_model)
+        llm = default_llm()
     
     template_manager = TemplateManager()
     system_prompt = template_manager.analyze_spec_implementation_system_prompt()
@@ -18,15 +15,9 @@ def analyze_spec_implementation(spec_code: str, scenario_text: str, llm: LangCha
     
     response = response.strip()
     
-    code_block_pattern = r'```(?:json)?\n?(.*?)```'
-    match = re.search(code_block_pattern, response, re.DOTALL)
-    if match:
-        response = match.group(1).strip()
-    
-    try:
-        json.loads(response)
-    except json.JSONDecodeError:
-        pass
+    block = extract_code_block(response, JSON_LANGUAGES)
+    if block is not None:
+        response = block.strip()
     
     return response
 
@@ -1,8 +1,7 @@
 import json
-import re
-from core.config import Config
 from core.template_manager import TemplateManager
-from core.llm import LangChainLLM
+from core.llm import LangChainLLM, default_llm
+from core.tools.parsing import JS_LANGUAGES, extract_code_block
 
 
 def compose_spec_with_base(base_code: str, additional_code: str, llm: LangChainLLM = None) -> str:
@@ -10,8 +9,7 @@ def compose_spec_with_base(base_code: str, additional_code: str, llm: LangChainL
         return base_code
     
     if llm is None:
-        config = Config()
-        llm = LangChainLLM(model=config.llm_model)
+        llm = default_llm()
     
     template_manager = TemplateManager()
     system_prompt = template_manager.compose_spec_system_prompt()
@@ -21,10 +19,9 @@ def compose_spec_with_base(base_code: str, additional_code: str, llm: LangChainL
     
     response = response.strip()
     
-    code_block_pattern = r'```(?:javascript|js)?\n?(.*?)```'
-    match = re.search(code_block_pattern, response, re.DOTALL)
-    if match:
-        response = match.group(1).strip()
+    block = extract_code_block(response, JS_LANGUAGES)
+    if block is not None:
+        response = block.strip()
     
     return response
 
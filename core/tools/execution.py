@@ -5,12 +5,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from core.tools.composition import compose_spec, compose_spec_with_base
 from core.playwright_env import ensure_playwright_environment
-from core.config import Config
+from core.config import default_config
 from core.template_manager import TemplateManager
-from core.llm import LangChainLLM
+from core.llm import LangChainLLM, default_llm
 
 
-@dataclass
+@dataclass(frozen=True)
 class Outcome:
     outcome: str
     duration: float
@@ -22,31 +22,27 @@ def run_playwright_spec(spec_path: str) -> Outcome:
     if not spec_file.exists():
         raise FileNotFoundError(f'Spec file not found: {spec_path}')
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         result = subprocess.run(
             ['npx', 'playwright', 'test', str(spec_file), '--reporter=json'],
             capture_output=True,
             text=True,
-            check=True,
             timeout=300
         )
-        outcome = 'passed'
+        outcome = 'passed' if result.returncode == 0 else 'failed'
         output = result.stdout + result.stderr
     except subprocess.TimeoutExpired as e:
         outcome = 'timeout'
         stdout = e.stdout.decode() if isinstance(e.stdout, bytes) else (e.stdout or '')
         stderr = e.stderr.decode() if isinstance(e.stderr, bytes) else (e.stderr or '')
         output = stdout + stderr
-    except subprocess.CalledProcessError as e:
-        outcome = 'failed'
-        output = e.stdout + e.stderr
     except Exception as e:
         outcome = 'error'
         output = str(e)
     
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     
     return Outcome(
         outcome=outcome,
@@ -66,12 +62,10 @@ def run_playwright_spec_tool(spec_path: str) -> str:
 
 def run_steps_with_page_state(code_lines: str, base_url: str = None, llm: LangChainLLM = None, existing_spec: str = None) -> str:
     if base_url is None:
-        config = Config()
-        base_url = config.connection_url or 'http://localhost:3000'
+        base_url = default_config().connection_url or 'http://localhost:3000'
     
     if llm is None:
-        config = Config()
-        llm = LangChainLLM(model=config.llm_model)
+        llm = default_llm()
     
     template_manager = TemplateManager()
     capture_state_code = template_manager.capture_page_state_template(base_url=base_url)
@@ -0,0 +1,25 @@
+from typing import Optional, Tuple
+
+
+_FENCE = '```'
+JS_LANGUAGES = ('javascript', 'js')
+JSON_LANGUAGES = ('json',)
+
+
+def extract_code_block(text: str, languages: Tuple[str, ...]) -> Optional[str]:
+    start = text.find(_FENCE)
+    if start == -1:
+        return None
+
+    position = start + len(_FENCE)
+    for language in languages:
+        if text.startswith(language, position):
+            position += len(language)
+            break
+    if text.startswith('\n', position):
+        position += 1
+
+    end = text.find(_FENCE, position)
+    if end == -1:
+        return None
+    return text[position:end]
@@ -4,42 +4,88 @@ from core.build_progress import BuildProgress
 from core.playwright_env import ensure_playwright_environment
 
 
-def read_build_progress() -> str:
-    glyph_dir = ensure_playwright_environment()
-    progress_path = glyph_dir / 'build_progress.json'
+_progress_cache = {}
+
+
+def _file_signature(path: Path):
+    stat = path.stat()
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _progress_path() -> Path:
+    return ensure_playwright_environment() / 'build_progress.json'
+
+
+def _load_progress() -> BuildProgress:
+    progress_path = _progress_path()
+    if not progress_path.exists():
+        return BuildProgress()
     
-    progress = BuildProgress.load(progress_path)
+    cache_key = progress_path.resolve()
+    signature = _file_signature(progress_path)
+    cached = _progress_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
     
-    scenarios_data = {
-        name: {
-            'scenario_name': prog.scenario_name,
-            'scenario_path': prog.scenario_path,
-            'status': prog.status,
-            'dependencies': prog.dependencies,
-            'references': getattr(prog, 'references', []),
-            'current_reference_building': prog.current_reference_building,
-            'error_message': prog.error_message,
-            'spec_file_path': prog.spec_file_path,
-        }
-        for name, prog in progress.scenarios.items()
+    progress = BuildProgress.load(progress_path)
+    _progress_cache[cache_key] = (signature, progress)
+    return progress
+
+
+def _save_progress(progress: BuildProgress):
+    progress_path = _progress_path()
+    cache_key = progress_path.resolve()
+    _progress_cache.pop(cache_key, None)
+    progress.save(progress_path)
+    _progress_cache[cache_key] = (_file_signature(progress_path), progress)
+
+
+def _scenario_details(prog) -> dict:
+    return {
+        'scenario_name': prog.scenario_name,
+        'scenario_path': prog.scenario_path,
+        'status': prog.status,
+        'dependencies': prog.dependencies,
+        'references': getattr(prog, 'references', []),
+        'current_reference_building': prog.current_reference_building,
+        'error_message': prog.error_message,
+        'spec_file_path': prog.spec_file_path,
     }
+
+
+def read_build_progress() -> str:
+    progress = _load_progress()
+    
+    scenarios_data = {}
+    not_yet_implemented = []
+    in_progress = []
+    completed = []
+    failed = []
+    
+    for name, prog in progress.scenarios.items():
+        scenarios_data[name] = _scenario_details(prog)
+        if prog.status == 'completed':
+            completed.append(name)
+        elif prog.status == 'failed':
+            failed.append(name)
+        else:
+            not_yet_implemented.append(name)
+            if prog.status == 'in_progress':
+                in_progress.append(name)
     
     return json.dumps({
         'success': True,
         'current_scenario': progress.current_scenario,
         'scenarios': scenarios_data,
-        'not_yet_implemented': progress.get_not_yet_implemented(),
-        'in_progress': progress.get_in_progress(),
-        'completed': progress.get_completed(),
-        'failed': progress.get_failed(),
+        'not_yet_implemented': not_yet_implemented,
+        'in_progress': in_progress,
+        'completed': completed,
+        'failed': failed,
     })
 
 
 def get_scenario_status(scenario_name: str) -> str:
-    glyph_dir = ensure_playwright_environment()
-    progress_path = glyph_dir / 'build_progress.json'
-    
-    progress = BuildProgress.load(progress_path)
+    progress = _load_progress()
     
     if scenario_name not in progress.scenarios:
         return json.dumps({
@@ -51,23 +97,13 @@ def get_scenario_status(scenario_name: str) -> str:
     
     return json.dumps({
         'success': True,
-        'scenario_name': prog.scenario_name,
-        'scenario_path': prog.scenario_path,
-        'status': prog.status,
-        'dependencies': prog.dependencies,
-        'references': getattr(prog, 'references', []),
-        'current_reference_building': prog.current_reference_building,
-        'error_message': prog.error_message,
-        'spec_file_path': prog.spec_file_path,
+        **_scenario_details(prog),
         'has_spec_code': prog.current_spec_code is not None,
     })
 
 
 def get_not_yet_implemented_scenarios() -> str:
-    glyph_dir = ensure_playwright_environment()
-    progress_path = glyph_dir / 'build_progress.json'
-    
-    progress = BuildProgress.load(progress_path)
+    progress = _load_progress()
     scenarios = progress.get_not_yet_implemented()
     
     return json.dumps({
@@ -78,10 +114,7 @@ def get_not_yet_implemented_scenarios() -> str:
 
 
 def update_scenario_status(scenario_name: str, status: str, error_message: str = None, spec_file_path: str = None) -> str:
-    glyph_dir = ensure_playwright_environment()
-    progress_path = glyph_dir / 'build_progress.json'
-    
-    progress = BuildProgress.load(progress_path)
+    progress = _load_progress()
     
     if scenario_name not in progress.scenarios:
         return json.dumps({
@@ -107,7 +140,7 @@ def update_scenario_status(scenario_name: str, status: str, error_message: str =
             'error': f'Invalid status: {status}. Must be one of: in_progress, completed, failed'
         })
     
-    progress.save(progress_path)
+    _save_progress(progress)
     
     return json.dumps({
         'success': True,
@@ -0,0 +1,41 @@
+from core.build_agent import _filter_page_state_output
+
+
+class TestFilterPageStateOutput:
+
+    def test_empty_output_returns_empty_string(self):
+        assert _filter_page_state_output('') == ''
+        assert _filter_page_state_output(None) == ''
+
+    def test_extracts_labelled_json_blocks(self):
+        output = 'Running 1 test\nPage State: {"url": "/home"}\nInteractive Elements: {"count": 2}\n1 passed'
+
+        assert _filter_page_state_output(output) == '{"url": "/home"}\n\n{"count": 2}'
+
+    def test_drops_runner_noise_and_error_traces(self):
+        output = '\r\n'.join([
+            'Running 1 test using 1 worker',
+            'Heading: Welcome',
+            'Error: locator not found',
+            '    at spec.js:10:5',
+            '',
+            'Button: Save',
+            '1 passed (2s)',
+        ])
+
+        assert _filter_page_state_output(output) == 'Heading: Welcome\nButton: Save'
+
+    def test_keeps_nested_json_blocks_intact(self):
+        output = 'Page State: {"url": "/users", "headings": {"h1": ["Users"]}, "forms": 1}\n1 passed'
+
+        assert _filter_page_state_output(output) == '{"url": "/users", "headings": {"h1": ["Users"]}, "forms": 1}'
+
+    def test_falls_back_to_first_closing_brace_for_non_json_text(self):
+        output = 'Page State: {\\n  \\"url\\": \\"/home\\"\\n}\\nrest } of report'
+
+        assert _filter_page_state_output(output) == '{\\n  \\"url\\": \\"/home\\"\\n}'
+
+    def test_drops_repeated_page_state_blocks(self):
+        output = 'Page State: {"url": "/a"}\nInteractive Elements: {"count": 1}\nFinal Page State: {"url": "/a"}'
+
+        assert _filter_page_state_output(output) == '{"url": "/a"}\n\n{"count": 1}'
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+from core.build_progress import BuildProgress, ScenarioProgress
+
+
+def _progress_with_scenario():
+    progress = BuildProgress()
+    progress.scenarios['login.glyph'] = ScenarioProgress(
+        scenario_name='login.glyph',
+        scenario_path='scenarios/login.glyph',
+        status='not_yet_implemented',
+        dependencies=[]
+    )
+    return progress
+
+
+class TestBuildProgressSave:
+
+    def test_save_roundtrips_through_load(self, tmp_path):
+        path = tmp_path / 'build_progress.json'
+        progress = _progress_with_scenario()
+        progress.mark_in_progress('login.glyph')
+
+        progress.save(path)
+        loaded = BuildProgress.load(path)
+
+        assert loaded.current_scenario == 'login.glyph'
+        assert loaded.scenarios['login.glyph'].status == 'in_progress'
+
+    def test_save_skips_write_when_nothing_changed(self, tmp_path):
+        path = tmp_path / 'build_progress.json'
+        progress = _progress_with_scenario()
+        progress.save(path)
+
+        with patch.object(Path, 'write_text') as write_text:
+            progress.save(path)
+
+        write_text.assert_not_called()
+
+    def test_save_writes_after_change(self, tmp_path):
+        path = tmp_path / 'build_progress.json'
+        progress = _progress_with_scenario()
+        progress.save(path)
+
+        progress.mark_failed('login.glyph', 'boom')
+        progress.save(path)
+
+        data = json.loads(path.read_text())
+        assert data['scenarios']['login.glyph']['status'] == 'failed'
+
+    def test_save_rewrites_missing_file(self, tmp_path):
+        path = tmp_path / 'build_progress.json'
+        progress = _progress_with_scenario()
+        progress.save(path)
+        path.unlink()
+
+        progress.save(path)
+
+        assert path.exists()
+
+    def test_save_leaves_no_temporary_file(self, tmp_path):
+        path = tmp_path / 'build_progress.json'
+        progress = _progress_with_scenario()
+
+        progress.save(path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ['build_progress.json']
@@ -0,0 +1,107 @@
+import json
+from unittest.mock import MagicMock
+import pytest
+from core.llm import LangChainLLM
+from core.llm_cache import LLMCache
+from core.scenario import Scenario
+
+
+def _llm_with_stub(cache, content='answer', model='gpt-4o-mini', temperature=0):
+    llm = LangChainLLM(model=model, api_key='test-key', temperature=temperature, cache=cache)
+    llm.llm = MagicMock()
+    llm.llm.invoke.return_value = MagicMock(content=content)
+    return llm
+
+
+class TestLangChainLLMProcess:
+
+    def test_repeated_prompt_is_served_from_cache(self, tmp_path):
+        llm = _llm_with_stub(LLMCache(tmp_path, enabled=True))
+
+        first = llm.process('prompt', system_prompt='system')
+        second = llm.process('prompt', system_prompt='system')
+
+        assert first == second == 'answer'
+        assert llm.llm.invoke.call_count == 1
+
+    def test_different_system_prompt_is_a_cache_miss(self, tmp_path):
+        llm = _llm_with_stub(LLMCache(tmp_path, enabled=True))
+
+        llm.process('prompt', system_prompt='system')
+        llm.process('prompt', system_prompt='other system')
+
+        assert llm.llm.invoke.call_count == 2
+
+    def test_disabled_cache_always_calls_model(self):
+        llm = _llm_with_stub(LLMCache(enabled=False))
+
+        llm.process('prompt', system_prompt='system')
+        llm.process('prompt', system_prompt='system')
+
+        assert llm.llm.invoke.call_count == 2
+
+    def test_response_is_reused_across_instances_via_disk_cache(self, tmp_path):
+        first = _llm_with_stub(LLMCache(tmp_path, enabled=True))
+        first.process('prompt', system_prompt='system')
+
+        second = _llm_with_stub(LLMCache(tmp_path, enabled=True), content='fresh')
+
+        assert second.process('prompt', system_prompt='system') == 'answer'
+        second.llm.invoke.assert_not_called()
+
+    def test_disk_cache_is_keyed_by_model(self, tmp_path):
+        _llm_with_stub(LLMCache(tmp_path, enabled=True)).process('prompt')
+
+        other = _llm_with_stub(LLMCache(tmp_path, enabled=True), content='fresh', model='gpt-4o')
+
+        assert other.process('prompt') == 'fresh'
+
+    def test_disk_cache_is_keyed_by_temperature(self, tmp_path):
+        _llm_with_stub(LLMCache(tmp_path, enabled=True)).process('prompt')
+
+        other = _llm_with_stub(LLMCache(tmp_path, enabled=True), content='fresh', temperature=0.7)
+
+        assert other.process('prompt') == 'fresh'
+
+
+    def test_unparseable_response_is_not_persisted(self, tmp_path):
+        template_manager = MagicMock()
+        template_manager.scenario_to_steps.return_value = 'prompt'
+        scenario = Scenario('Log in')
+        fenced = '```json\n["Open the login page"]\n```'
+
+        first = _llm_with_stub(LLMCache(tmp_path, enabled=True), content=fenced)
+        with pytest.raises(json.JSONDecodeError):
+            scenario.to_steps(first, template_manager)
+
+        rerun = _llm_with_stub(LLMCache(tmp_path, enabled=True), content='["Open the login page"]')
+
+        assert scenario.to_steps(rerun, template_manager) == ['Open the login page']
+        assert rerun.llm.invoke.call_count == 1
+
+    def test_cached_response_that_fails_to_parse_is_evicted(self, tmp_path):
+        cache = LLMCache(tmp_path, enabled=True)
+        _llm_with_stub(cache, content='not json').process('prompt')
+
+        llm = _llm_with_stub(cache, content='[1]')
+        with pytest.raises(ValueError):
+            llm.process_json('prompt')
+
+        assert list(tmp_path.iterdir()) == []
+        assert llm.process_json('prompt') == [1]
+        assert llm.llm.invoke.call_count == 1
+
+
+class TestLLMCache:
+
+    def test_key_separates_part_boundaries(self):
+        assert LLMCache.key('ab', 'c') != LLMCache.key('a', 'bc')
+
+    def test_env_flag_disables_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('GLYPH_LLM_CACHE', '0')
+        cache = LLMCache(tmp_path)
+
+        cache.put('key', 'value', 'model')
+
+        assert cache.get('key') is None
+        assert list(tmp_path.iterdir()) == []
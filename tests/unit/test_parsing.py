@@ -0,0 +1,50 @@
+import random
+import re
+import pytest
+from core.tools.parsing import JS_LANGUAGES, JSON_LANGUAGES, extract_code_block
+
+
+_JS_BLOCK_RE = re.compile(r'```(?:javascript|js)?\n?(.*?)```', re.DOTALL)
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\n?(.*?)```', re.DOTALL)
+
+
+def _regex_block(pattern, text):
+    match = pattern.search(text)
+    return match.group(1) if match else None
+
+
+class TestExtractCodeBlock:
+
+    def test_returns_none_without_fence(self):
+        assert extract_code_block('const a = 1;', JS_LANGUAGES) is None
+
+    def test_returns_none_without_closing_fence(self):
+        assert extract_code_block('```js\nconst a = 1;', JS_LANGUAGES) is None
+
+    def test_strips_language_tag_and_newline(self):
+        assert extract_code_block('Here:\n```javascript\nconst a = 1;\n```\nDone', JS_LANGUAGES) == 'const a = 1;\n'
+
+    def test_unknown_language_tag_is_kept_in_block(self):
+        assert extract_code_block('```ts\nlet a;\n```', JS_LANGUAGES) == 'ts\nlet a;\n'
+
+    def test_empty_block_is_distinguished_from_no_block(self):
+        assert extract_code_block('``````', JS_LANGUAGES) == ''
+
+    def test_returns_first_block_only(self):
+        assert extract_code_block('```js\na\n```\n```js\nb\n```', JS_LANGUAGES) == 'a\n'
+
+    @pytest.mark.parametrize('text', [
+        '````', '`````js', '```\n```', '```js```', '```jsx\n```', '```javascriptx```',
+        '```json\n{"a": 1}\n```', '```\r\n{}\n```', 'a ``` b ``` c ``` d',
+    ])
+    def test_matches_regex_on_edge_cases(self, text):
+        assert extract_code_block(text, JS_LANGUAGES) == _regex_block(_JS_BLOCK_RE, text)
+        assert extract_code_block(text, JSON_LANGUAGES) == _regex_block(_JSON_BLOCK_RE, text)
+
+    def test_matches_regex_on_random_inputs(self):
+        rng = random.Random(0)
+        alphabet = ['`', '```', 'js', 'json', 'javascript', '\n', ' ', 'x', '{}']
+        for _ in range(2000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            assert extract_code_block(text, JS_LANGUAGES) == _regex_block(_JS_BLOCK_RE, text), text
+            assert extract_code_block(text, JSON_LANGUAGES) == _regex_block(_JSON_BLOCK_RE, text), text
@@ -0,0 +1,63 @@
+import shutil
+import pytest
+from core.playwright_env import ensure_playwright_environment
+from core.template_manager import TemplateManager
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestEnsurePlaywrightEnvironment:
+
+    def test_writes_config_and_package_json(self, workspace):
+        glyph_dir = ensure_playwright_environment('http://a.test')
+
+        assert (glyph_dir / 'playwright.config.js').read_text() == TemplateManager().playwright_config('http://a.test')
+        assert (glyph_dir / 'package.json').exists()
+
+    def test_recreates_deleted_config_file(self, workspace):
+        glyph_dir = ensure_playwright_environment('http://a.test')
+        (glyph_dir / 'playwright.config.js').unlink()
+
+        ensure_playwright_environment('http://a.test')
+
+        assert (glyph_dir / 'playwright.config.js').exists()
+
+    def test_recreates_deleted_package_json(self, workspace):
+        glyph_dir = ensure_playwright_environment('http://a.test')
+        (glyph_dir / 'package.json').unlink()
+
+        ensure_playwright_environment('http://a.test')
+
+        assert (glyph_dir / 'package.json').exists()
+
+    def test_recreates_deleted_glyph_dir(self, workspace):
+        glyph_dir = ensure_playwright_environment('http://a.test')
+        shutil.rmtree(glyph_dir)
+
+        ensure_playwright_environment('http://a.test')
+
+        assert (glyph_dir / 'playwright.config.js').exists()
+        assert (glyph_dir / 'package.json').exists()
+
+    def test_prepares_each_working_directory(self, workspace, monkeypatch):
+        ensure_playwright_environment('http://a.test')
+        other = workspace / 'other'
+        other.mkdir()
+        monkeypatch.chdir(other)
+
+        ensure_playwright_environment('http://a.test')
+
+        assert (other / '.glyph' / 'playwright.config.js').exists()
+
+    def test_rewrites_config_when_base_url_changes(self, workspace):
+        glyph_dir = ensure_playwright_environment('http://a.test')
+
+        ensure_playwright_environment('http://b.test')
+        assert (glyph_dir / 'playwright.config.js').read_text() == TemplateManager().playwright_config('http://b.test')
+
+        ensure_playwright_environment('http://a.test')
+        assert (glyph_dir / 'playwright.config.js').read_text() == TemplateManager().playwright_config('http://a.test')
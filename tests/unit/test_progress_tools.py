@@ -0,0 +1,94 @@
+import json
+import os
+from unittest.mock import patch
+import pytest
+from core.build_progress import BuildProgress, ScenarioProgress
+from core.playwright_env import ensure_playwright_environment
+from core.tools import progress as progress_tools
+
+
+@pytest.fixture
+def progress_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = ensure_playwright_environment() / 'build_progress.json'
+    progress = BuildProgress()
+    progress.scenarios['login.glyph'] = ScenarioProgress(
+        scenario_name='login.glyph',
+        scenario_path='scenarios/login.glyph',
+        status='not_yet_implemented',
+        dependencies=[]
+    )
+    progress.save(path)
+    return path
+
+
+class TestProgressTools:
+
+    def test_unchanged_file_is_parsed_once(self, progress_path):
+        with patch.object(BuildProgress, 'load', wraps=BuildProgress.load) as load:
+            progress_tools.read_build_progress()
+            progress_tools.get_scenario_status('login.glyph')
+
+        assert load.call_count == 1
+
+    def test_external_write_is_picked_up(self, progress_path):
+        progress_tools.read_build_progress()
+
+        progress = BuildProgress.load(progress_path)
+        progress.mark_failed('login.glyph', 'boom')
+        progress.save(progress_path)
+
+        status = json.loads(progress_tools.get_scenario_status('login.glyph'))
+        assert status['status'] == 'failed'
+
+    def test_update_is_visible_without_reparsing(self, progress_path):
+        progress_tools.update_scenario_status('login.glyph', 'in_progress')
+
+        with patch.object(BuildProgress, 'load', wraps=BuildProgress.load) as load:
+            data = json.loads(progress_tools.read_build_progress())
+
+        load.assert_not_called()
+        assert data['in_progress'] == ['login.glyph']
+
+    def test_failed_save_does_not_leave_change_in_cache(self, progress_path):
+        progress_tools.read_build_progress()
+
+        with patch.object(BuildProgress, 'save', side_effect=OSError('disk full')):
+            with pytest.raises(OSError):
+                progress_tools.update_scenario_status('login.glyph', 'in_progress')
+
+        status = json.loads(progress_tools.get_scenario_status('login.glyph'))
+        assert status['status'] == 'not_yet_implemented'
+
+    def test_same_size_rewrite_within_one_tick_is_reloaded(self, progress_path):
+        progress = BuildProgress.load(progress_path)
+        progress.current_scenario = 'a.glyph'
+        progress.save(progress_path)
+        progress_tools.read_build_progress()
+        original = progress_path.stat()
+
+        progress.current_scenario = 'b.glyph'
+        progress.save(progress_path)
+        os.utime(progress_path, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+        assert progress_path.stat().st_size == original.st_size
+        data = json.loads(progress_tools.read_build_progress())
+        assert data['current_scenario'] == 'b.glyph'
+
+    def test_read_build_progress_buckets_match_progress_queries(self, progress_path):
+        progress = BuildProgress.load(progress_path)
+        for name, status in [('a.glyph', 'in_progress'), ('b.glyph', 'completed'), ('c.glyph', 'failed')]:
+            progress.scenarios[name] = ScenarioProgress(
+                scenario_name=name,
+                scenario_path=f'scenarios/{name}',
+                status=status,
+                dependencies=[]
+            )
+        progress.save(progress_path)
+
+        data = json.loads(progress_tools.read_build_progress())
+
+        assert data['not_yet_implemented'] == progress.get_not_yet_implemented() == ['login.glyph', 'a.glyph']
+        assert data['in_progress'] == progress.get_in_progress()
+        assert data['completed'] == progress.get_completed()
+        assert data['failed'] == progress.get_failed()